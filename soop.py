@@ -8,13 +8,18 @@ GPL-3.0 License
 """
 
 import datetime
+import os
 import time
 import re
 import sys
 from collections import namedtuple
-import pytz
-from skyfield.api import load, wgs84, Time
-from timezonefinder import TimezoneFinder
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache, partial
+from zoneinfo import ZoneInfo
+import numpy as np
+from sgp4.api import Satrec
+from skyfield.api import EarthSatellite, load, wgs84, Time
 
 # Constants - Please change according to your requirements
 QTH_DEF = "OJ11xi"  # your default qth locator
@@ -36,6 +41,7 @@ EL_MIN = 10.    # minimum elevation angle (deg) for a satellite event
 MIN_DUR = 3     # minimum duration (minutes) for a satellite event
 TLE_OUT = 3     # days after TLE is treated as outdated
 FC_WARNING = 7  # display warning when forecast exceeds FC_WARNING days
+PAR_SAT_DAYS = 150  # track in parallel processes from satellites x forecast days on
 
 Col = namedtuple(
     'color',
@@ -52,20 +58,28 @@ COL = Col(red="\033[1;31;48m",
           end="\033[1;37;0m"
           )
 
-CEL_TRK = "https://celestrak.com/satcat/tle.php"  # for tle download
+CEL_TRK = "https://celestrak.org/NORAD/elements/gp.php"  # for tle download
+TLE_GRP = "amateur"  # celestrak group containing the satellites
+
+# Input validation
+_LOC_RE = re.compile(r"([A-Ra-r]{2}\d\d)(([A-Za-z]{2})(\d\d)?){0,2}")
+_DATE_RE = re.compile(r'^2\d{3}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])')
+_TIME_RE = re.compile(r"^([0-1][0-9]|2[0-3]):[0-5][0-9]")
 
 # Global variables
 qth_loc = QTH_DEF
 my_sats = SATS_DEF
 
+# Module level cache
+_SAT_BY_NUMBER = {}  # EarthSatellite by Norad catalogue number, see check_tle
+_TIMESCALE = load.timescale()
+_TZ_F = None  # timezone finder, created on first use
+_GEO_POS = {}  # geo position of earth station by qth locator
+_TLE_FRESH = set()  # tle files checked to be up-to-date during this session
 
-def get_key(item):
-    """
-    Needed for sorting sorted() the time list
-    :param item:
-    :return:
-    """
-    return item
+
+# Fractional resolution of latitude for index of letter/number pair
+_FRAC = tuple(10 ** (1 - (i + 1) // 2) * 24 ** -(i // 2) for i in range(10))
 
 
 def f_10_24(j: int) -> float:
@@ -74,9 +88,10 @@ def f_10_24(j: int) -> float:
     :param j: index of letter/number pair
     :return: calculated fractional degrees
     """
-    return 10 ** (1 - int((j + 1) / 2)) * 24 ** int(-j / 2)
+    return _FRAC[j]
 
 
+@lru_cache(maxsize=32)
 def maiden2latlon(loctr: str) -> tuple:
     """
     Calculates latitude, longitude in decimal degrees,
@@ -84,47 +99,50 @@ def maiden2latlon(loctr: str) -> tuple:
     :param loctr: Maidenhead locator 4 up to 10 characters
     :return: lon, lat (dg decimal) or None, None (invalid input)
     """
-    lon = lat = -90
-    # check validity of input
-    if not re.match(r"([A-Ra-r]{2}\d\d)(([A-Za-z]{2})(\d\d)?){0,2}", loctr):
+    match = _LOC_RE.match(loctr)  # check validity of input
+    if not match:
         return None, None
-    lets = re.findall(r'([A-Xa-x]{2})', loctr)  # all letter pairs
-    nums = re.findall(r'(\d)(\d)', loctr)  # all number pairs
-    vals = [(ord(x[0].upper()) - ord("A"),
-             ord(x[1].upper()) - ord("A")) for x in lets]
-    nums = [(int(x[0]), int(x[1])) for x in nums]
-    pairs = [tuple] * (len(vals) + len(nums))  # prepare empty list
-    pairs[::2] = vals  # letter value pairs 0, 2, 4 ...
-    pairs[1::2] = nums  # number value pairs 1, 3, 5 ...
-    for i, (x_1, x_2) in enumerate(pairs):
-        lon += f_10_24(i) * x_1
-        lat += f_10_24(i) * x_2
+    loc = match[0].upper()
+    n_pairs = len(loc) // 2
+    lon = lat = -90
+    for i in range(n_pairs):
+        # letter pairs 0, 2, 4 ... number pairs 1, 3, 5 ...
+        ofs = ord("A") if i % 2 == 0 else ord("0")
+        lon += _FRAC[i] * (ord(loc[2 * i]) - ofs)
+        lat += _FRAC[i] * (ord(loc[2 * i + 1]) - ofs)
     lon *= 2
-    lon += f_10_24(len(pairs)-1) / 2  # Centre of the field
-    lat += f_10_24(len(pairs)-1) / 2
+    lon += _FRAC[n_pairs - 1] / 2  # Centre of the field
+    lat += _FRAC[n_pairs - 1] / 2
     return round(lat, 6), round(lon, 6)
 
 
-def sat_track(geo_pos, dt_start, dt_end, cat_n):
+@lru_cache(maxsize=32)
+def _tz_for(lat: float, lon: float) -> str:
+    """
+    Timezone name for a geo position (rounded coordinates)
+    :param lat: latitude (dg decimal)
+    :param lon: longitude (dg decimal)
+    :return: timezone name
+    """
+    global _TZ_F
+    if _TZ_F is None:  # import on first use, loading timezonefinder takes a while
+        from timezonefinder import TimezoneFinder
+        _TZ_F = TimezoneFinder()
+    return _TZ_F.timezone_at(lng=lon, lat=lat)
+
+
+def sat_track(geo_pos, t_start, t_end, cat_n):
     """
     Find events for a satellite with a specific catalogue number on given date
-    Download TLE from celestrack and put results into global list timelist
     :param geo_pos: geo position of earth station
-    :param dt_start: earliest datetime to start operation
-    :param dt_end: latest datetime to finish operation
+    :param t_start: earliest time to start operation (skyfield Time)
+    :param t_end: latest time to finish operation (skyfield Time)
     :param cat_n: Norad catalogue number of satellite (int)
     :return: list of events for satellite with cat_n
     """
     ev_list = []
-    url = CEL_TRK + '?CATNR={}'.format(cat_n)
-    fname = 'tle-CATNR-{}.txt'.format(cat_n)
     t_aos = None
-    time_sc = load.timescale()
-    sats = load.tle_file(url, filename=fname)
-    by_number = {sat.model.satnum: sat for sat in sats}
-    satellite = by_number[cat_n]
-    t_start = time_sc.from_datetime(dt_start)
-    t_end = time_sc.from_datetime(dt_end)
+    satellite = _SAT_BY_NUMBER[cat_n]
     t_event, events = satellite.find_events(geo_pos, t_start, t_end, altitude_degrees=EL_MIN)
     for t_li, event in zip(t_event, events):
         # Convert time object to timestamp
@@ -134,65 +152,152 @@ def sat_track(geo_pos, dt_start, dt_end, cat_n):
         if event == 2 and t_aos is not None:  # LOS
             t_dur = int((time_sc - t_aos)/60)
             if t_dur > MIN_DUR:  # more than 3 minutes
-                ev_list.append([t_aos, t_dur, satellite.name])
+                ev_list.append((int(t_aos), t_dur, satellite.name))
     return ev_list
 
 
-def find_best_time(op_h: int, ev_sorted: list):
+def _track_tt(geo_pos, tt_start, tt_end, cat_n):
     """
-    Loop through all events to find the optimal operation start time for h hours
+    sat_track for worker processes, times are passed as TT Julian dates
+    :param geo_pos: geo position of earth station
+    :param tt_start: earliest time to start operation (TT)
+    :param tt_end: latest time to finish operation (TT)
+    :param cat_n: Norad catalogue number of satellite (int)
+    :return: list of events for satellite with cat_n
+    """
+    return sat_track(geo_pos, _TIMESCALE.tt_jd(tt_start), _TIMESCALE.tt_jd(tt_end), cat_n)
+
+
+def _init_worker(cats):
+    """
+    Initializer for sat_track worker processes
+    Load satellites from the tle file when not inherited from the parent process
+    :param cats: set of Norad catalogue numbers to be tracked
+    :return: void
+    """
+    if not _SAT_BY_NUMBER:
+        fname = 'tle-{}.txt'.format(TLE_GRP)
+        _SAT_BY_NUMBER.update(read_tle(load.path_to(fname), cats))
+
+
+def find_best_time(op_h: int, ev_ts, ev_dur):
+    """
+    Find the optimal operation start time for h hours from all events
     :param op_h: operation period in hours
-    :param ev_sorted list of time sorted events for all satellites
+    :param ev_ts: time sorted AOS timestamps of all events (int64 array)
+    :param ev_dur: durations in min of the time sorted events (int32 array)
     :return: itf, itl first and last index of satellite, best start time in UTC, duration in min
     """
-    delta_t = datetime.timedelta(hours=op_h)
-    tti = 0  # total time for
-    ttd = 0  # total time duration
-    itl = 0  # index of last sat to operate
-    itf = 0  # index of first sat to operate
-    m_sats = len(ev_sorted)
-    for i_sat in range(0, m_sats):
-        tmax = datetime.datetime.fromtimestamp(ev_sorted[i_sat][0]) + delta_t
-        jtl = 0
-        for j_sat in range(i_sat, m_sats):
-            if datetime.datetime.fromtimestamp(ev_sorted[j_sat][0]) < tmax:
-                tti += ev_sorted[j_sat][1]
-                jtl += 1
-        if tti > ttd:
-            itf = i_sat
-            itl = itf + jtl - 1
-        ttd = max(ttd, tti)
-        tti = 0
-    return itf, itl, ev_sorted[itf][0], ttd
+    if len(ev_ts) == 0:  # no event
+        return 0, -1, 0, 0
+    if len(ev_ts) == 1:
+        return 0, 0, int(ev_ts[0]), int(ev_dur[0])
+    delta_t = op_h * 3600  # operation period in s
+    # index after last sat within the operation window for each start event
+    j_end = np.searchsorted(ev_ts, ev_ts + delta_t, side='left')
+    t_cum = np.concatenate(([0], np.cumsum(ev_dur, dtype=np.int64)))
+    tti = t_cum[j_end] - t_cum[:-1]  # total time for window starting at each event
+    itf = int(np.argmax(tti))  # index of first sat to operate
+    itl = int(j_end[itf]) - 1  # index of last sat to operate
+    return itf, itl, int(ev_ts[itf]), int(tti[itf])
+
+
+def read_tle(fpath, cats) -> dict:
+    """
+    Read satellites from a three line tle file
+    Only satellites with a catalogue number in cats are created
+    :param fpath: path of tle file
+    :param cats: set of Norad catalogue numbers
+    :return: dict of skyfield EarthSatellite by Norad catalogue number
+    """
+    with open(fpath, encoding='ascii') as tle_f:
+        lines = [line.rstrip() for line in tle_f if line.strip()]
+    by_number = {}
+    for i in range(0, len(lines) - 2, 3):
+        name, line1, line2 = lines[i:i + 3]
+        try:
+            cat_n = int(line1[2:7])
+        except ValueError:  # alpha-5 catalogue number
+            continue
+        if cat_n in cats:
+            satellite = EarthSatellite.from_satrec(Satrec.twoline2rv(line1, line2), _TIMESCALE)
+            satellite.name = name.strip()
+            by_number[cat_n] = satellite
+    return by_number
 
 
-def check_tle(sat_list):
+def add_tle(fpath, cats):
     """
-    Check whether tle files need to be loaded and up-to-date
-    Otherwise reload from celestrack
-    :param sat_list: list of satellites with Norad catalogue numbers
+    Download tle data of satellites not in the TLE_GRP group from celestrack
+    and append them to the group tle file. The modification time of the file
+    is kept, so that the age of the group data still decides on reloading
+    :param fpath: path of group tle file
+    :param cats: set of Norad catalogue numbers missing in the group file
     :return: void
     """
-    for sat_name in sat_list:
-        url = 'https://celestrak.com/satcat/tle.php?CATNR={}'.format(sat_list[sat_name])
-        fname = 'tle-CATNR-{}.txt'.format(sat_list[sat_name])
+    f_time = os.path.getmtime(fpath)
+    for cat_n in sorted(cats):
+        fname = 'tle-CATNR-{}.txt'.format(cat_n)
         try:
-            sat = load.tle_file(url, reload=False, filename=fname)
+            load.download(CEL_TRK + '?CATNR={}&FORMAT=tle'.format(cat_n), filename=fname)
         except(OSError, TimeoutError):
-            print(f"{COL.red}Can not download TLE data. Please check internet connection.{COL.end}")
-            sys.exit(1)
-        if not sat:
-            print(f"{COL.red}Invalid Satellite list, "
-                  f"no TLE data for catalogue no {sat_name}{COL.end}")
-            print(f"{COL.red}Please correct your list{COL.end}")
-            sys.exit(1)
-        tle_days = int(load.days_old(fname))
-        if tle_days > TLE_OUT:
-            print(f"TLE data for {sat_name} outdated, reloading from celestrack")
+            print(f"{COL.yellow}Warning: Cannot download TLE data for "
+                  f"catalogue no {cat_n}. Please check Internet{COL.end}")
+            continue
+        cat_path = load.path_to(fname)
+        if read_tle(cat_path, {cat_n}):  # celestrack answers with a text for unknown numbers
+            with open(cat_path, encoding='ascii') as cat_f, \
+                    open(fpath, 'a', encoding='ascii') as grp_f:
+                grp_f.write("\n" + cat_f.read())
+        os.remove(cat_path)
+    os.utime(fpath, (f_time, f_time))
+
+
+def check_tle(sat_list):
+    """
+    Check whether the tle group file needs to be loaded and is up-to-date
+    Otherwise reload from celestrack. All satellites of the TLE_GRP group
+    are fetched with one request, others are added to the group file by add_tle
+    :param sat_list: list of satellites with Norad catalogue numbers
+    :return: dict of satellites by Norad catalogue number
+    """
+    url = CEL_TRK + '?GROUP={}&FORMAT=tle'.format(TLE_GRP)
+    fname = 'tle-{}.txt'.format(TLE_GRP)
+    cats = set(sat_list.values())
+    if fname in _TLE_FRESH and cats <= _SAT_BY_NUMBER.keys():  # checked during this session
+        by_number = _SAT_BY_NUMBER
+    else:
+        fpath = load.path_to(fname)
+        tle_days = int((time.time() - os.path.getmtime(fpath)) / 86400) \
+            if os.path.exists(fpath) else 0
+        fresh = tle_days <= TLE_OUT
+        if not fresh:
+            print(f"TLE data for {TLE_GRP} group outdated, reloading from celestrack")
             try:
-                load.tle_file(url, reload=True, filename=fname)
+                load.download(url, filename=fname)
+                fresh = True
             except(OSError, TimeoutError):
                 print(f"{COL.yellow}Warning: Cannot update TLE data. Please check Internet{COL.end}")
+        if not os.path.exists(fpath):
+            try:
+                load.download(url, filename=fname)
+            except(OSError, TimeoutError):
+                print(f"{COL.red}Can not download TLE data. "
+                      f"Please check internet connection.{COL.end}")
+                sys.exit(1)
+        if fresh:
+            _TLE_FRESH.add(fname)
+        by_number = read_tle(fpath, cats)
+        if not cats <= by_number.keys():
+            add_tle(fpath, cats - by_number.keys())
+            by_number = read_tle(fpath, cats)
+    for sat_name in sat_list:
+        if sat_list[sat_name] not in by_number:
+            print(f"{COL.red}Invalid Satellite list, no TLE data at celestrack "
+                  f"for {sat_name}, catalogue no {sat_list[sat_name]}{COL.end}")
+            print(f"{COL.red}Please correct your list{COL.end}")
+            sys.exit(1)
+    return by_number
 
 
 def get_qth():
@@ -206,7 +311,7 @@ def get_qth():
         print(f"QTH locator of operation ( 6 up to 10 alphanum.), default "
               f"{COL.cyan}{QTH_DEF}{COL.end}: ", end="")
         qth_loc = input() or QTH_DEF
-        if re.match(r"([A-Ra-r]{2}\d\d)(([A-Za-z]{2})(\d\d)?){0,2}", qth_loc):
+        if _LOC_RE.match(qth_loc):
             break
         else:
             print("Locator has 3 to 5 character/number pairs, like PK04lc")
@@ -218,8 +323,6 @@ def get_input():
     Get input from user
     :return: date of operation, start and end time, duration and days to be forecasted
     """
-    valid_date = re.compile(r'^2\d{3}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])')
-    valid_time = re.compile(r"^([0-1][0-9]|2[0-3]):[0-5][0-9]")
     dt_day = datetime.timedelta(days=1)  # tomorrow
     dte_start = (datetime.datetime.now() + dt_day).strftime("%Y-%m-%d")
 
@@ -227,24 +330,27 @@ def get_input():
         print(f"1. Earliest date of operation, default "
               f"{COL.cyan}tomorrow{COL.end} (YYYY-MM-DD): ", end="")
         line = input() or dte_start
-        if re.match(valid_date, line):
-            dte_start = re.match(valid_date, line)[0]
+        match = _DATE_RE.match(line)
+        if match:
+            dte_start = match[0]
             break
         print(f"{COL.red}Invalid input{COL.end}")
     while True:
         print(f"2. Earliest time of operation, default "
               f"{COL.cyan}09:00{COL.end} (hh:mm): ", end="")
         line = input() or "09:00"
-        if re.match(valid_time, line):
-            tme_start = re.match(valid_time, line)[0]
+        match = _TIME_RE.match(line)
+        if match:
+            tme_start = match[0]
             break
         print(f"{COL.red}Invalid input{COL.end}")
     while True:
         print(f"3. Latest time to finish operation, default "
               f"{COL.cyan}22:00{COL.end} (hh:mm): ", end="")
         line = input() or "20:00"
-        if re.match(valid_time, line):
-            tme_end = re.match(valid_time, line)[0]
+        match = _TIME_RE.match(line)
+        if match:
+            tme_end = match[0]
             break
         print(f"{COL.red}Invalid input{COL.end}")
     while True:
@@ -298,27 +404,29 @@ def soop_init():
     # Header output
     print(f"\n{COL.cyan}SOOP Satellite Outdoor Operation Planning for ham radio by 9V1KG{COL.end}")
     print("(c) 9V1KG - Check https://github.com/9V1KG/soop for latest updates")
-    check_tle(SATS_DEF)
+    _SAT_BY_NUMBER.update(check_tle(SATS_DEF))
     get_pc_timezone()
     print("For default input just press enter")
     get_qth()
 
 
-def soop():
+def soop(pool=None):
     """
     Main program to forecast and find optimal time period for
     outdoor ham radio satellite operation
+    :param pool: ProcessPoolExecutor for forecasts of at least PAR_SAT_DAYS, None for serial
     :return: void
     """
     global qth_loc, my_sats
-    tz_f = TimezoneFinder()  # initialize timezone finder
 
     # Input
     lat, lon = maiden2latlon(qth_loc)
-    tz_qth = tz_f.timezone_at(lng=lon, lat=lat)  # Timezone based on qth locator
-    geo_pos = wgs84.latlon(lat, lon)  # Get geo_pos from qth locator
-    qth_zone = pytz.timezone(tz_qth)
-    ofs = qth_zone.localize(datetime.datetime.now()).utcoffset()
+    tz_qth = _tz_for(lat, lon)  # Timezone based on qth locator
+    if qth_loc not in _GEO_POS:
+        _GEO_POS[qth_loc] = wgs84.latlon(lat, lon)  # Get geo_pos from qth locator
+    geo_pos = _GEO_POS[qth_loc]
+    qth_zone = ZoneInfo(tz_qth)
+    ofs = datetime.datetime.now(qth_zone).utcoffset()
     print(f"Timezone based on QTH locator {COL.yellow}{qth_loc}{COL.end}"
           f" is {COL.yellow}{qth_zone}{COL.end}.",
           f"\nDate and Time are shown for this timezone, UTC offset is {ofs}\n")
@@ -335,36 +443,47 @@ def soop():
     # Local time (based on qth locator)
     fmt = "%Y-%m-%d %H:%M"
     earliest_start_of_op_loc \
-        = qth_zone.localize(datetime.datetime.strptime(earliest_start_of_op_str, fmt))
+        = datetime.datetime.strptime(earliest_start_of_op_str, fmt).replace(tzinfo=qth_zone)
     latest_start_of_op_loc \
-        = qth_zone.localize(datetime.datetime.strptime(latest_start_of_op_str, fmt))
+        = datetime.datetime.strptime(latest_start_of_op_str, fmt).replace(tzinfo=qth_zone)
     # UTC
-    earliest_start_of_op_utc = earliest_start_of_op_loc.astimezone(pytz.UTC)
-    latest_start_of_op_utc = latest_start_of_op_loc.astimezone(pytz.UTC)
+    earliest_start_of_op_utc = earliest_start_of_op_loc.astimezone(datetime.timezone.utc)
+    latest_start_of_op_utc = latest_start_of_op_loc.astimezone(datetime.timezone.utc)
 
+    cats = list(dict.fromkeys(my_sats.values()))  # catalogue numbers without duplicates
+    if len(cats) * fc_days < PAR_SAT_DAYS:  # process start up and transfer cost more
+        pool = None
     # Loop through all days to be forecasted
     for fc_day in range(0, fc_days):
         fc_date_utc_start = earliest_start_of_op_utc + datetime.timedelta(days=fc_day)
         fc_date_utc_end = latest_start_of_op_utc + datetime.timedelta(days=fc_day)
         fc_date_loc = earliest_start_of_op_loc + datetime.timedelta(days=fc_day)
+        t_start = _TIMESCALE.from_datetime(fc_date_utc_start)
+        t_end = _TIMESCALE.from_datetime(fc_date_utc_end)
         # Loop through all satellites
         time_list = []
-        for sat in my_sats:
-            # call function to find events
-            evnts = sat_track(geo_pos, fc_date_utc_start, fc_date_utc_end, my_sats[sat])
+        if pool:  # send tt floats, a Time object carries its whole Timescale
+            all_evnts = pool.map(partial(_track_tt, geo_pos, t_start.tt, t_end.tt), cats)
+        else:
+            all_evnts = map(partial(sat_track, geo_pos, t_start, t_end), cats)
+        for evnts in all_evnts:
             if evnts is not None:
                 time_list.extend(evnts)
         # sort by timestamp
-        tls_sorted = sorted(time_list, key=get_key)
+        ev_ts = np.array([ev[0] for ev in time_list], dtype=np.int64)
+        ev_dur = np.array([ev[1] for ev in time_list], dtype=np.int32)
+        order = np.argsort(ev_ts, kind='stable')
+        ev_ts, ev_dur = ev_ts[order], ev_dur[order]
+        tls_sorted = [time_list[i] for i in order]
         res = None
         if tls_sorted:
             # Find optimal operation start time for the day
-            res = find_best_time(op_hours, tls_sorted)
+            res = find_best_time(op_hours, ev_ts, ev_dur)
             print(str(fc_date_loc).split(" ", maxsplit=1)[0],
                   f"{COL.yellow}{res[1] - res[0] + 1}{COL.end} of {len(tls_sorted)} satellites"
                   f" within {op_hours} h operation, "
                   f"starting at{COL.yellow} ",
-                  datetime.datetime.fromtimestamp(res[2]).astimezone(qth_zone).strftime("%H:%M:%S"),
+                  datetime.datetime.fromtimestamp(res[2], tz=qth_zone).strftime("%H:%M:%S"),
                   f"{COL.end},"
                   f"total time:{COL.yellow} {res[3]} min{COL.end}")
         else:  # no event
@@ -373,30 +492,34 @@ def soop():
         # 0: index first sat 1: index last sat 2: AOS 3: duration 2: Satellite name
 
         # list satellites when forecast days is set to 1
-        if res and fc_days == 1:
+        if fc_days == 1 and res is not None:
             n_sl = len(tls_sorted)
             t_diff = 0
+            lines = []
             for i_sl, ops in enumerate(tls_sorted):
                 if i_sl < n_sl - 1:
                     # break time until next satellite is coming in min
                     t_diff = (tls_sorted[i_sl + 1][0] - (ops[0] + ops[1] * 60)) / 60
-                tobs = datetime.datetime.fromtimestamp(ops[0]).astimezone(qth_zone)
+                tobs_str = datetime.datetime.fromtimestamp(ops[0], tz=qth_zone).strftime('%H:%M:%S')
                 if res[0] <= i_sl <= res[1]:  # Sats within operation period in green
-                    print(f"{COL.green}{tobs.strftime('%H:%M:%S ')}"
-                          f"{tls_sorted[i_sl][2]} {ops[1]} min{COL.end},"
-                          f" next in {int(t_diff)} min")
+                    lines.append(f"{COL.green}{tobs_str} {ops[2]} {ops[1]} min{COL.end},"
+                                 f" next in {int(t_diff)} min")
                 else:
-                    print(f"{COL.end}{tobs.strftime('%H:%M:%S ')}"
-                          f"{tls_sorted[i_sl][2]} {ops[1]} min{COL.end}")
+                    lines.append(f"{COL.end}{tobs_str} {ops[2]} {ops[1]} min{COL.end}")
+            sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == '__main__':
     soop_init()
-    while True:
-        soop()
-        print(f"\nNew forecast for {COL.yellow}{qth_loc}{COL.end} "
-              f"(y/n, default = y)?", end="")
-        cont = input() or "y"
-        if cont != "y":
-            break
+    # Worker processes only pay off with more than one cpu, they are
+    # started when the first forecast is long enough to use them
+    with ProcessPoolExecutor(initializer=_init_worker, initargs=(set(my_sats.values()),)) \
+            if (os.cpu_count() or 1) > 1 else nullcontext() as sat_pool:
+        while True:
+            soop(sat_pool)
+            print(f"\nNew forecast for {COL.yellow}{qth_loc}{COL.end} "
+                  f"(y/n, default = y)?", end="")
+            cont = input() or "y"
+            if cont != "y":
+                break
     print("Program finished")